@@ -8,49 +8,83 @@ Simple utility to query and display appointments from the database.
 import sqlite3
 import json
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Optional
 from dotenv import load_dotenv
 import os
 
+from timezone_utils import normalize_to_pacific
+
 # Single env file at repo root (LifeSynced/.env.local)
 _env_path = Path(__file__).resolve().parent / ".env.local"
 load_dotenv(dotenv_path=_env_path)
 DB_PATH = os.getenv('DB_PATH', 'calendar.db')
 
+DISPLAY_DATETIME_FORMAT = '%Y-%m-%d %H:%M'
+
 
 def format_datetime(dt_str: str) -> str:
     """Format ISO datetime string for display."""
     try:
-        dt = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
-        return dt.strftime('%Y-%m-%d %H:%M')
+        # Stored times carry a numeric offset; only a trailing 'Z' needs rewriting
+        # (fromisoformat accepts 'Z' natively only from Python 3.11)
+        if dt_str.endswith('Z'):
+            dt_str = dt_str[:-1] + '+00:00'
+        dt = datetime.fromisoformat(dt_str)
+        return dt.strftime(DISPLAY_DATETIME_FORMAT)
     except (ValueError, AttributeError):
         return dt_str
 
 
+def parse_stored_time(dt_str: str) -> Optional[datetime]:
+    """Parse a stored start/end time to an aware datetime.
+    
+    Times without an offset (Graph API, fetched with a Pacific Prefer header) are
+    Pacific wall time.
+    """
+    if dt_str.endswith('Z'):
+        dt_str = dt_str[:-1] + '+00:00'
+    try:
+        dt = datetime.fromisoformat(dt_str)
+    except ValueError:
+        try:
+            # Graph returns 7 fractional digits; fromisoformat (before 3.11) accepts at most 6
+            dt = datetime.fromisoformat(dt_str[:26])
+        except ValueError:
+            return None
+    return normalize_to_pacific(dt)
+
+
 def list_appointments(limit: int = 20, days_ahead: int = 30):
     """List upcoming appointments."""
-    # Use UTC-aware datetime for proper comparison
-    from datetime import timezone as tz
-    now = datetime.now(tz.utc)
-    end_date = now + timedelta(days=days_ahead)
-    
-    # Convert to ISO strings for SQL comparison
-    now_str = now.isoformat()
-    end_date_str = end_date.isoformat()
-    
     with sqlite3.connect(DB_PATH) as conn:
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
+        # Stored start_time offsets differ by source (Graph: Pacific wall time with no
+        # offset, iCloud: Pacific -07:00/-08:00, ICS: UTC +00:00), so the query selects
+        # whole days like CalendarDatabase.query_events. A bare 'YYYY-MM-DD' bound
+        # compares as a date prefix of the stored ISO strings, so this stays a range
+        # scan on idx_start_time. The lower bound starts a day early (a Pacific date
+        # trails the UTC date by at most one); rows that already started are dropped
+        # below by comparing instants.
         cursor.execute('''
             SELECT * FROM appointments 
-            WHERE start_time >= ? AND start_time <= ?
+            WHERE start_time >= date('now', '-1 day')
+            AND start_time < date('now', ? || ' days', '+1 day')
             ORDER BY start_time ASC
-            LIMIT ?
-        ''', (now_str, end_date_str, limit))
+        ''', (days_ahead,))
         
-        rows = cursor.fetchall()
+        now = datetime.now(timezone.utc)
+        rows = []
+        for row in cursor:
+            start = parse_stored_time(row['start_time'] or '')
+            if start is not None and start < now:
+                continue
+            rows.append(row)
+            if len(rows) >= limit:
+                break
         
         if not rows:
             print("No upcoming appointments found.")
@@ -63,7 +97,7 @@ def list_appointments(limit: int = 20, days_ahead: int = 30):
             print(f"End: {format_datetime(row['end_time'])}")
             if row['location']:
                 print(f"Location: {row['location']}")
-            print(f"Source: {row.get('source', 'unknown')}")
+            print(f"Source: {row['source'] or 'unknown'}")
             print("-" * 50)
 
 
@@ -72,23 +106,16 @@ def show_stats():
     with sqlite3.connect(DB_PATH) as conn:
         cursor = conn.cursor()
         
-        cursor.execute('SELECT COUNT(*) FROM appointments')
-        total = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM appointments WHERE source = ?', ('graph_api',))
-        graph_count = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM appointments WHERE source = ?', ('ics',))
-        ics_count = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM appointments WHERE source = ?', ('apple_calendar',))
-        apple_count = cursor.fetchone()[0]
+        # Single ordered pass over the idx_source index instead of one COUNT(*) per source
+        cursor.execute('SELECT source, COUNT(*) FROM appointments GROUP BY source')
+        counts = dict(cursor.fetchall())
+        total = sum(counts.values())
         
         print(f"\nDatabase Statistics:\n")
         print(f"Total appointments: {total}")
-        print(f"  - Graph API: {graph_count}")
-        print(f"  - ICS Feed: {ics_count}")
-        print(f"  - Apple Calendar: {apple_count}")
+        print(f"  - Graph API: {counts.get('graph_api', 0)}")
+        print(f"  - ICS Feed: {counts.get('ics', 0)}")
+        print(f"  - Apple Calendar: {counts.get('apple_calendar', 0)}")
 
 
 if __name__ == '__main__':
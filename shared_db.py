@@ -7,16 +7,110 @@ Eliminates code duplication and ensures consistency.
 """
 
 import sqlite3
+import json
 import logging
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import itemgetter
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence, Tuple
 from pathlib import Path
 import os
 
 from timezone_utils import normalize_to_utc, parse_iso_datetime
 
+try:
+    import orjson
+except ImportError:
+    # Optional: faster JSON encoding; the stdlib json module is used without it
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Insert-or-update for one appointment row; created_at is kept for existing rows
+_UPSERT_APPOINTMENT_SQL = '''
+    INSERT INTO appointments 
+    (id, subject, start_time, end_time, location, organizer_email, 
+     organizer_name, attendees, body_preview, is_all_day, source, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        subject = excluded.subject, start_time = excluded.start_time, end_time = excluded.end_time,
+        location = excluded.location, organizer_email = excluded.organizer_email,
+        organizer_name = excluded.organizer_name, attendees = excluded.attendees,
+        body_preview = excluded.body_preview, is_all_day = excluded.is_all_day,
+        source = excluded.source, updated_at = excluded.updated_at
+'''
+
+# Appointment fields stored after id, in _UPSERT_APPOINTMENT_SQL column order,
+# with the defaults used when a record omits one
+_APPOINTMENT_FIELD_DEFAULTS = {
+    'subject': '',
+    'start_time': '',
+    'end_time': '',
+    'location': '',
+    'organizer_email': '',
+    'organizer_name': '',
+    'attendees': '[]',
+    'body_preview': '',
+    'is_all_day': 0,
+    'source': '',
+}
+_get_appointment_fields = itemgetter(*_APPOINTMENT_FIELD_DEFAULTS)
+
+# Fields of an appointment row for save_appointments_tuples, in the order they
+# are written (created_at/updated_at are added by the database layer)
+APPOINTMENT_COLUMNS = ('id',) + tuple(_APPOINTMENT_FIELD_DEFAULTS)
+
+# Secondary indexes on appointments as (name, columns)
+_APPOINTMENT_INDEXES = (
+    ('idx_start_time', 'start_time'),
+    ('idx_source', 'source'),
+    # Per-source range/ordered scans
+    ('idx_source_start_time', 'source, start_time'),
+    # Common queries and find_duplicate lookups
+    ('idx_subject_source_time', 'subject, source, start_time'),
+    # Date range queries
+    ('idx_end_time', 'end_time'),
+)
+
+# Batches inserting more than this many new rows, and at least as many as are
+# already stored, drop the indexes find_duplicate does not use and rebuild them
+# once after the write instead of updating them row by row. A rebuild covers the
+# whole table, so re-syncs (mostly updates) into a large table keep the indexes.
+BULK_INDEX_THRESHOLD = 500
+
+# Max ids per "WHERE id IN (...)" lookup (stays under SQLite's bound-parameter limit)
+_ID_LOOKUP_CHUNK = 500
+
+@lru_cache(maxsize=2048)
+def serialize_attendees(attendees: Tuple[str, ...]) -> str:
+    """Encode an attendee email list for the appointments.attendees column.
+    
+    Cached because every occurrence of a recurring series (and repeated
+    meetings) carries the same attendee list. Uses orjson when installed
+    (compact separators; the stored JSON decodes the same either way).
+    """
+    if orjson:
+        return orjson.dumps(attendees).decode()
+    return json.dumps(list(attendees))
+
+
+# Shared CalendarDatabase instances, keyed by db_path (see get_database)
+_databases: Dict[str, 'CalendarDatabase'] = {}
+
+
+def get_database(db_path: str) -> 'CalendarDatabase':
+    """Get the shared CalendarDatabase for a path.
+    
+    All sync scripts in a process reuse one instance per database file, so the
+    connection is opened, tuned and schema-checked once rather than per sync.
+    """
+    db = _databases.get(db_path)
+    if db is None:
+        db = _databases[db_path] = CalendarDatabase(db_path)
+    return db
+
 
 class CalendarDatabase:
     """Unified database interface for calendar events."""
@@ -24,11 +118,37 @@ class CalendarDatabase:
     def __init__(self, db_path: str):
         """Initialize database connection and schema."""
         self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        # Serializes use of the shared connection (syncs may run in parallel threads)
+        self._lock = threading.RLock()
         self._init_database()
     
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Use this database's connection, tuned for bulk sync writes.
+        
+        The connection is opened once and reused, so pragmas are applied once and
+        sqlite3's per-connection statement cache keeps hot statements prepared.
+        Access is serialized with a lock; the block commits on success and rolls
+        back on error (the connection stays open).
+        """
+        with self._lock:
+            if self._conn is None:
+                conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                # WAL (set once in _init_database) is safe with synchronous=NORMAL:
+                # one fsync per checkpoint instead of one per transaction
+                conn.execute('PRAGMA synchronous=NORMAL')
+                conn.execute('PRAGMA temp_store=MEMORY')
+                conn.execute('PRAGMA cache_size=-65536')  # 64 MiB page cache
+                self._conn = conn
+            with self._conn:
+                yield self._conn
+    
     def _init_database(self) -> None:
         """Initialize SQLite database and create tables/indexes."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
+            # journal_mode is persistent, so this only needs to happen once per file
+            conn.execute('PRAGMA journal_mode=WAL')
             cursor = conn.cursor()
             
             # Create appointments table
@@ -58,27 +178,8 @@ class CalendarDatabase:
                 pass
             
             # Create indexes for performance
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_start_time 
-                ON appointments(start_time)
-            ''')
-            
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_source 
-                ON appointments(source)
-            ''')
-            
-            # Create composite index for common queries (subject + source + start_time)
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_subject_source_time 
-                ON appointments(subject, source, start_time)
-            ''')
-            
-            # Create index for end_time (used in date range queries)
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_end_time 
-                ON appointments(end_time)
-            ''')
+            for name, columns in _APPOINTMENT_INDEXES:
+                cursor.execute('CREATE INDEX IF NOT EXISTS {} ON appointments({})'.format(name, columns))
             
             # Create ignored_base_ids table (for ignoring entire recurring series)
             cursor.execute('''
@@ -101,10 +202,25 @@ class CalendarDatabase:
                 )
             ''')
             
+            # Create feed_cache table (HTTP validators + last body per ICS URL for conditional GETs)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS feed_cache (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body BLOB,
+                    fetched_at TEXT
+                )
+            ''')
+            
             conn.commit()
     
-    def find_duplicate(self, subject: str, start_time: str, organizer_email: str, source: str, exclude_id: Optional[str] = None) -> Optional[str]:
-        """Find duplicate event by subject, start_time, and organizer_email."""
+    def find_duplicate(self, subject: str, start_time: str, organizer_email: str, source: str, exclude_id: Optional[str] = None,
+                       cursor: Optional[sqlite3.Cursor] = None) -> Optional[str]:
+        """Find duplicate event by subject, start_time, and organizer_email.
+        
+        Pass ``cursor`` to run the lookup inside an already open transaction.
+        """
         try:
             start_dt = parse_iso_datetime(start_time)
             if not start_dt:
@@ -115,50 +231,79 @@ class CalendarDatabase:
             time_window_start = (start_utc - timedelta(seconds=60)).isoformat()
             time_window_end = (start_utc + timedelta(seconds=60)).isoformat()
             
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
+            if cursor is None:
+                with self._connect() as conn:
+                    return self.find_duplicate(subject, start_time, organizer_email, source, exclude_id,
+                                               cursor=conn.cursor())
+            
+            # Optimized query: filter by subject, source, and time window in SQL
+            # Then check exact time match and organizer_email in Python
+            if exclude_id:
+                cursor.execute('''
+                    SELECT id, start_time, organizer_email FROM appointments 
+                    WHERE subject = ? AND source = ? 
+                    AND start_time >= ? AND start_time <= ?
+                    AND id != ?
+                ''', (subject, source, time_window_start, time_window_end, exclude_id))
+            else:
+                cursor.execute('''
+                    SELECT id, start_time, organizer_email FROM appointments 
+                    WHERE subject = ? AND source = ? 
+                    AND start_time >= ? AND start_time <= ?
+                ''', (subject, source, time_window_start, time_window_end))
+            
+            for row_id, row_start_time, row_org_email in cursor.fetchall():
+                if row_id == exclude_id:
+                    continue
                 
-                # Optimized query: filter by subject, source, and time window in SQL
-                # Then check exact time match and organizer_email in Python
-                if exclude_id:
-                    cursor.execute('''
-                        SELECT id, start_time, organizer_email FROM appointments 
-                        WHERE subject = ? AND source = ? 
-                        AND start_time >= ? AND start_time <= ?
-                        AND id != ?
-                    ''', (subject, source, time_window_start, time_window_end, exclude_id))
-                else:
-                    cursor.execute('''
-                        SELECT id, start_time, organizer_email FROM appointments 
-                        WHERE subject = ? AND source = ? 
-                        AND start_time >= ? AND start_time <= ?
-                    ''', (subject, source, time_window_start, time_window_end))
+                row_start_dt = parse_iso_datetime(row_start_time)
+                if not row_start_dt:
+                    continue
                 
-                for row_id, row_start_time, row_org_email in cursor.fetchall():
-                    if row_id == exclude_id:
-                        continue
-                    
-                    row_start_dt = parse_iso_datetime(row_start_time)
-                    if not row_start_dt:
-                        continue
-                    
-                    row_start_utc = normalize_to_utc(row_start_dt)
-                    
-                    # Check if times match within 1 minute
-                    time_diff = abs((start_utc - row_start_utc).total_seconds())
-                    if time_diff < 60:
-                        # Check organizer_email
-                        if (organizer_email or '') == (row_org_email or ''):
-                            return row_id
+                row_start_utc = normalize_to_utc(row_start_dt)
                 
-                return None
+                # Check if times match within 1 minute
+                time_diff = abs((start_utc - row_start_utc).total_seconds())
+                if time_diff < 60:
+                    # Check organizer_email
+                    if (organizer_email or '') == (row_org_email or ''):
+                        return row_id
+            
+            return None
         except Exception as e:
             logger.warning(f"Error finding duplicate: {e}")
             return None
     
     def save_appointments(self, appointments: List[Dict[str, Any]], deduplication_rules: Optional[Dict[str, Any]] = None) -> Tuple[int, int]:
-        """Save appointments to database with deduplication."""
-        if not appointments:
+        """Save appointments to database with deduplication.
+        
+        Records are turned into rows and saved with save_appointments_tuples.
+        """
+        rows = []
+        for event_data in appointments:
+            if not event_data:
+                continue
+            
+            event_id = event_data.get('id')
+            if not event_id:
+                continue
+            
+            rows.append(self._appointment_row(event_id, event_data))
+        
+        return self.save_appointments_tuples(APPOINTMENT_COLUMNS, rows, deduplication_rules)
+    
+    def save_appointments_tuples(self, columns: Sequence[str], rows: Iterable[Sequence[Any]],
+                                 deduplication_rules: Optional[Dict[str, Any]] = None) -> Tuple[int, int]:
+        """Save appointment rows given as tuples, with deduplication.
+        
+        ``columns`` names the fields of each row and must be APPOINTMENT_COLUMNS.
+        Existing sources for the batch are fetched up front, insert-vs-update is
+        decided in Python, and rows are written with one executemany UPSERT.
+        """
+        if tuple(columns) != APPOINTMENT_COLUMNS:
+            raise ValueError("Appointment rows must be in APPOINTMENT_COLUMNS order: {}".format(APPOINTMENT_COLUMNS))
+        rows = [row for row in rows if row[0]]
+        if not rows:
             return (0, 0)
         
         saved_count = 0
@@ -169,24 +314,32 @@ class CalendarDatabase:
         precedence = deduplication_rules.get('precedence', {})
         current_source = deduplication_rules.get('source', '')
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
+            # Take the write lock up front so the whole batch is one transaction
+            # (one commit/fsync) rather than racing other writers row by row
+            cursor.execute('BEGIN IMMEDIATE')
             now = datetime.now(timezone.utc).isoformat()
             
-            for event_data in appointments:
-                if not event_data:
-                    continue
-                
-                event_id = event_data.get('id')
-                if not event_id:
-                    continue
-                
-                # Check if event already exists
-                cursor.execute('SELECT id, source FROM appointments WHERE id = ?', (event_id,))
-                existing = cursor.fetchone()
+            existing_sources = self._get_existing_sources(cursor, [row[0] for row in rows])
+            
+            # DDL is transactional in SQLite: if the batch fails, the rollback
+            # restores the dropped indexes along with the data
+            bulk_indexes = ()
+            new_count = len({row[0] for row in rows} - existing_sources.keys())
+            if new_count > BULK_INDEX_THRESHOLD:
+                cursor.execute('SELECT COUNT(*) FROM appointments')
+                if new_count >= cursor.fetchone()[0]:
+                    bulk_indexes = [index for index in _APPOINTMENT_INDEXES if index[0] != 'idx_subject_source_time']
+                    for name, _ in bulk_indexes:
+                        cursor.execute('DROP INDEX IF EXISTS {}'.format(name))
+            pending = []
+            
+            for row in rows:
+                event_id, subject, start_time, _, _, organizer_email, _, _, _, _, event_source = row
                 
-                if existing:
-                    existing_id, existing_source = existing
+                if event_id in existing_sources:
+                    existing_source = existing_sources[event_id]
                     # Check precedence rules
                     if current_source and existing_source:
                         current_precedence = precedence.get(current_source, 0)
@@ -203,42 +356,33 @@ class CalendarDatabase:
                             continue
                     
                     # Update existing record
-                    cursor.execute('''
-                        UPDATE appointments
-                        SET subject = ?, start_time = ?, end_time = ?, location = ?,
-                            organizer_email = ?, organizer_name = ?, attendees = ?,
-                            body_preview = ?, is_all_day = ?, source = ?, updated_at = ?
-                        WHERE id = ?
-                    ''', (
-                        event_data.get('subject', ''),
-                        event_data.get('start_time', ''),
-                        event_data.get('end_time', ''),
-                        event_data.get('location', ''),
-                        event_data.get('organizer_email', ''),
-                        event_data.get('organizer_name', ''),
-                        event_data.get('attendees', '[]'),
-                        event_data.get('body_preview', ''),
-                        event_data.get('is_all_day', 0),
-                        event_data.get('source', ''),
-                        now,
-                        event_id
-                    ))
                     updated_count += 1
-                else:
+                elif skip_same_source or not current_source or current_source != event_source:
+                    # find_duplicate only matches rows of the event's own source, so when
+                    # that is the deduplication source (and same-source rows are not
+                    # skipped) a match is inserted anyway and the lookup can be skipped.
+                    # Otherwise flush pending rows so the lookup sees them.
+                    if pending:
+                        cursor.executemany(_UPSERT_APPOINTMENT_SQL, pending)
+                        pending = []
+                    
                     # Check for duplicates by subject/start/organizer
                     duplicate_id = self.find_duplicate(
-                        event_data.get('subject', ''),
-                        event_data.get('start_time', ''),
-                        event_data.get('organizer_email', ''),
-                        event_data.get('source', ''),
-                        exclude_id=event_id
+                        subject,
+                        start_time,
+                        organizer_email,
+                        event_source,
+                        exclude_id=event_id,
+                        cursor=cursor
                     )
                     
                     if duplicate_id:
                         # Check precedence
-                        cursor.execute('SELECT source FROM appointments WHERE id = ?', (duplicate_id,))
-                        dup_source = cursor.fetchone()
-                        dup_source = dup_source[0] if dup_source else ''
+                        dup_source = existing_sources.get(duplicate_id)
+                        if dup_source is None:
+                            cursor.execute('SELECT source FROM appointments WHERE id = ?', (duplicate_id,))
+                            dup_source = cursor.fetchone()
+                            dup_source = dup_source[0] if dup_source else ''
                         
                         if current_source and dup_source:
                             current_precedence = precedence.get(current_source, 0)
@@ -249,26 +393,8 @@ class CalendarDatabase:
                                 continue
                             elif current_precedence > dup_precedence:
                                 # Higher precedence, update the duplicate
-                                cursor.execute('''
-                                    UPDATE appointments
-                                    SET subject = ?, start_time = ?, end_time = ?, location = ?,
-                                        organizer_email = ?, organizer_name = ?, attendees = ?,
-                                        body_preview = ?, is_all_day = ?, source = ?, updated_at = ?
-                                    WHERE id = ?
-                                ''', (
-                                    event_data.get('subject', ''),
-                                    event_data.get('start_time', ''),
-                                    event_data.get('end_time', ''),
-                                    event_data.get('location', ''),
-                                    event_data.get('organizer_email', ''),
-                                    event_data.get('organizer_name', ''),
-                                    event_data.get('attendees', '[]'),
-                                    event_data.get('body_preview', ''),
-                                    event_data.get('is_all_day', 0),
-                                    event_data.get('source', ''),
-                                    now,
-                                    duplicate_id
-                                ))
+                                pending.append((duplicate_id, *row[1:], now, now))
+                                existing_sources[duplicate_id] = event_source
                                 updated_count += 1
                                 continue
                             elif skip_same_source and current_source == dup_source:
@@ -279,34 +405,55 @@ class CalendarDatabase:
                             continue
                     
                     # Insert new record
-                    cursor.execute('''
-                        INSERT INTO appointments 
-                        (id, subject, start_time, end_time, location, organizer_email, 
-                         organizer_name, attendees, body_preview, is_all_day, source, created_at, updated_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        event_id,
-                        event_data.get('subject', ''),
-                        event_data.get('start_time', ''),
-                        event_data.get('end_time', ''),
-                        event_data.get('location', ''),
-                        event_data.get('organizer_email', ''),
-                        event_data.get('organizer_name', ''),
-                        event_data.get('attendees', '[]'),
-                        event_data.get('body_preview', ''),
-                        event_data.get('is_all_day', 0),
-                        event_data.get('source', ''),
-                        now,
-                        now
-                    ))
                     saved_count += 1
+                else:
+                    # Insert new record
+                    saved_count += 1
+                
+                pending.append((*row, now, now))
+                existing_sources[event_id] = event_source
+            
+            if pending:
+                cursor.executemany(_UPSERT_APPOINTMENT_SQL, pending)
+            
+            for name, columns in bulk_indexes:
+                cursor.execute('CREATE INDEX IF NOT EXISTS {} ON appointments({})'.format(name, columns))
             
             conn.commit()
         
         return (saved_count, updated_count)
     
+    @staticmethod
+    def _get_existing_sources(cursor: sqlite3.Cursor, event_ids: List[str]) -> Dict[str, str]:
+        """Map each already stored id among event_ids to its source."""
+        event_ids = list({event_id for event_id in event_ids if event_id})
+        existing_sources = {}
+        for i in range(0, len(event_ids), _ID_LOOKUP_CHUNK):
+            chunk = event_ids[i:i + _ID_LOOKUP_CHUNK]
+            cursor.execute(
+                'SELECT id, source FROM appointments WHERE id IN ({})'.format(','.join('?' * len(chunk))),
+                chunk
+            )
+            existing_sources.update(cursor.fetchall())
+        return existing_sources
+    
+    @staticmethod
+    def _appointment_row(event_id: str, event_data: Dict[str, Any]) -> Tuple:
+        """Build the APPOINTMENT_COLUMNS row for one appointment record."""
+        try:
+            # Parser records carry every field; one C-level lookup builds the tuple
+            fields = _get_appointment_fields(event_data)
+        except KeyError:
+            fields = tuple(event_data.get(key, default) for key, default in _APPOINTMENT_FIELD_DEFAULTS.items())
+        return (event_id, *fields)
+    
     def save_appointments_batch(self, appointments: List[Dict[str, Any]], deduplication_rules: Optional[Dict[str, Any]] = None) -> Tuple[int, int]:
-        """Save appointments in batch for better performance."""
+        """Save appointments in batch for better performance.
+        
+        The whole batch is written in one BEGIN IMMEDIATE transaction (a single
+        commit) with one executemany UPSERT, so callers need no transaction of
+        their own.
+        """
         return self.save_appointments(appointments, deduplication_rules)
     
     def query_events(self, days_back: int = 0, days_ahead: int = 30, source: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -325,9 +472,9 @@ class CalendarDatabase:
         start_date_str = start_date.isoformat()
         end_date_str = (end_date + timedelta(days=1)).isoformat()  # Include full end day
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._connect() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             # Query using date prefix comparison (works regardless of timezone offset in stored times)
             # This ensures we get all events that START on or after start_date and START before end_date+1
@@ -374,22 +521,22 @@ class CalendarDatabase:
     
     def get_ignored_base_ids(self) -> set:
         """Get set of ignored base IDs."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute('SELECT base_id FROM ignored_base_ids')
             return {row[0] for row in cursor.fetchall()}
     
     def get_ignored_base_ids_list(self) -> List[Dict[str, Any]]:
         """Get list of ignored base IDs with details."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._connect() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             cursor.execute('SELECT base_id, subject, ignored_at FROM ignored_base_ids ORDER BY ignored_at DESC')
             return [dict(row) for row in cursor.fetchall()]
     
     def add_ignored_base_id(self, base_id: str, subject: str, reason: str = 'User ignored') -> None:
         """Add a base ID to the ignored list."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             now = datetime.now(timezone.utc).isoformat()
             cursor.execute('''
@@ -400,29 +547,29 @@ class CalendarDatabase:
     
     def remove_ignored_base_id(self, base_id: str) -> None:
         """Remove a base ID from the ignored list."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute('DELETE FROM ignored_base_ids WHERE base_id = ?', (base_id,))
             conn.commit()
     
     def get_ignored_event_ids(self) -> set:
         """Get set of ignored specific event IDs."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute('SELECT event_id FROM ignored_event_ids')
             return {row[0] for row in cursor.fetchall()}
     
     def get_ignored_event_ids_list(self) -> List[Dict[str, Any]]:
         """Get list of ignored specific event IDs with details."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._connect() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             cursor.execute('SELECT event_id, subject, start_time, ignored_at FROM ignored_event_ids ORDER BY ignored_at DESC')
             return [dict(row) for row in cursor.fetchall()]
     
     def add_ignored_event_id(self, event_id: str, subject: str, start_time: str, reason: str = 'User ignored') -> None:
         """Add a specific event ID to the ignored list."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             now = datetime.now(timezone.utc).isoformat()
             cursor.execute('''
@@ -433,11 +580,31 @@ class CalendarDatabase:
     
     def remove_ignored_event_id(self, event_id: str) -> None:
         """Remove a specific event ID from the ignored list."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute('DELETE FROM ignored_event_ids WHERE event_id = ?', (event_id,))
             conn.commit()
     
+    def get_feed_cache(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get cached ETag/Last-Modified and body for an ICS URL."""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute('SELECT etag, last_modified, body FROM feed_cache WHERE url = ?', (url,))
+            row = cursor.fetchone()
+            return dict(row) if row else None
+    
+    def save_feed_cache(self, url: str, etag: Optional[str], last_modified: Optional[str], body: Any) -> None:
+        """Store HTTP validators and body for an ICS URL."""
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            now = datetime.now(timezone.utc).isoformat()
+            cursor.execute('''
+                INSERT OR REPLACE INTO feed_cache (url, etag, last_modified, body, fetched_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (url, etag, last_modified, body, now))
+            conn.commit()
+    
     def get_base_id_from_event_id(self, event_id: str) -> str:
         """Extract base ID from event ID (handles {base_id}_{timestamp} format)."""
         if '_' in event_id:
@@ -7,6 +7,7 @@ Master script to sync all configured calendars (Outlook Graph API, Outlook ICS,
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -14,6 +15,7 @@ from dotenv import load_dotenv
 from sync_calendar import CalendarSync
 from sync_calendar_ics import CalendarSyncICS
 from sync_apple_calendar import AppleCalendarSync
+from shared_db import get_database
 
 # Single env file at repo root (LifeSynced/.env.local)
 _env_path = Path(__file__).resolve().parent / ".env.local"
@@ -25,6 +27,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+DB_PATH = os.getenv('DB_PATH', 'calendar.db')
+
 # Flag to skip Graph API sync (useful when waiting for admin consent)
 SKIP_GRAPH_API = os.getenv('SKIP_GRAPH_API', 'False').lower() == 'true'
 
@@ -38,9 +42,12 @@ def sync_all():
     
     sync_operations = []
     
+    # One shared database instance (connection, pragmas, prepared statements) for all syncs
+    db = get_database(DB_PATH)
+    
     # 1. Microsoft Graph API sync
     if not SKIP_GRAPH_API:
-        sync_operations.append(('Work Outlook Calendar (Microsoft Graph API)', lambda: CalendarSync().sync()))
+        sync_operations.append(('Work Outlook Calendar (Microsoft Graph API)', lambda: CalendarSync(db=db).sync()))
     else:
         logger.info("SYNC 1/2: Work Outlook Calendar (Microsoft Graph API) - SKIPPED")
         logger.info("-" * 80)
@@ -49,32 +56,40 @@ def sync_all():
         logger.info("")
     
     # 2. Outlook ICS Feed sync
-    sync_operations.append(('Work Outlook Calendar (ICS Feed)', lambda: CalendarSyncICS().sync()))
+    sync_operations.append(('Work Outlook Calendar (ICS Feed)', lambda: CalendarSyncICS(db=db).sync()))
     
     # 3. Apple Calendar sync
-    sync_operations.append(('Personal iCloud Calendars', lambda: AppleCalendarSync().sync()))
+    sync_operations.append(('Personal iCloud Calendars', lambda: AppleCalendarSync(db=db).sync()))
     
     completed = 0
     skipped = 0
     failed = []
     
-    for i, (name, sync_func) in enumerate(sync_operations, 1):
-        if name.endswith('SKIPPED'):
-            skipped += 1
-            continue
+    # The syncs are independent and mostly wait on the network, so run them
+    # concurrently; CalendarDatabase serializes their writes to the shared connection
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = {}
+        for i, (name, sync_func) in enumerate(sync_operations, 1):
+            if name.endswith('SKIPPED'):
+                skipped += 1
+                continue
             
-        logger.info("SYNC {}/{}: {}".format(i, len(sync_operations), name))
-        logger.info("-" * 80)
+            logger.info("SYNC {}/{}: {}".format(i, len(sync_operations), name))
+            futures[executor.submit(sync_func)] = name
         
-        try:
-            sync_func()
-            logger.info("✓ {} sync completed".format(name))
-            completed += 1
-        except Exception as e:
-            logger.error("✗ {} sync failed: {}".format(name, e))
-            failed.append((name, str(e)))
+        logger.info("-" * 80)
         
-        logger.info("")
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                future.result()
+                logger.info("✓ {} sync completed".format(name))
+                completed += 1
+            except Exception as e:
+                logger.error("✗ {} sync failed: {}".format(name, e))
+                failed.append((name, str(e)))
+    
+    logger.info("")
     
     # Summary
     logger.info("=" * 80)
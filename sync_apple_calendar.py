@@ -10,20 +10,21 @@ Supports multiple methods:
 """
 
 import os
-import json
 import logging
-import sqlite3
-from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 from icalendar import Calendar, Event
 from icalendar.prop import vRecur
 from dateutil.rrule import rrule, DAILY, WEEKLY, MONTHLY, YEARLY, MO, TU, WE, TH, FR, SA, SU
 from dotenv import load_dotenv
 
-from shared_db import CalendarDatabase
-from timezone_utils import get_date_range, normalize_to_utc, parse_iso_datetime, normalize_to_pacific
+from shared_db import CalendarDatabase, get_database, serialize_attendees
+from timezone_utils import get_date_range, normalize_to_pacific, pacific_isoformat, pacific_midnight
 from pathlib import Path
 
 # Single env file at repo root (LifeSynced/.env.local)
@@ -41,6 +42,13 @@ APPLE_CALENDAR_ICS_PATH = os.getenv('APPLE_CALENDAR_ICS_PATH')
 APPLE_CALENDAR_DB_PATH = os.getenv('APPLE_CALENDAR_DB_PATH', os.path.expanduser('~/Library/Calendars/Calendar.sqlite'))
 DB_PATH = os.getenv('DB_PATH', 'calendar.db')
 
+# Max concurrent ICS downloads (and pooled connections per host)
+ICS_FETCH_WORKERS = 8
+
+# RRULE FREQ / BYDAY values to dateutil constants
+_FREQ_MAP = {'DAILY': DAILY, 'WEEKLY': WEEKLY, 'MONTHLY': MONTHLY, 'YEARLY': YEARLY}
+_DAY_MAP = {'MO': MO, 'TU': TU, 'WE': WE, 'TH': TH, 'FR': FR, 'SA': SA, 'SU': SU}
+
 
 def _parse_multiple_values(value: Optional[str]) -> List[str]:
     """Parse comma-separated values."""
@@ -49,6 +57,30 @@ def _parse_multiple_values(value: Optional[str]) -> List[str]:
     return [v.strip() for v in value.split(',') if v.strip()]
 
 
+def _until_to_datetime(until) -> Optional[datetime]:
+    """Convert an RRULE UNTIL value (datetime or date) to an aware datetime."""
+    until_val = until[0] if isinstance(until, list) else until
+    if isinstance(until_val, datetime):
+        if until_val.tzinfo is None:
+            until_val = until_val.replace(tzinfo=timezone.utc)
+        return until_val
+    if isinstance(until_val, date):
+        # It's a date, convert to datetime (end of that day)
+        return datetime.combine(until_val, datetime.max.time()).replace(tzinfo=timezone.utc)
+    return None
+
+
+@lru_cache(maxsize=64)
+def _parse_byday_token(token: str):
+    """Map a BYDAY token ('MO', '1MO', '-1FR') to a dateutil weekday, or None."""
+    d_str = token.upper()
+    # Handle nth weekday like "1MO" (first Monday)
+    if len(d_str) > 2 and d_str[-2:] in _DAY_MAP:
+        n = int(d_str[:-2]) if d_str[:-2].lstrip('-').isdigit() else None
+        return _DAY_MAP[d_str[-2:]](n) if n else _DAY_MAP[d_str[-2:]]
+    return _DAY_MAP.get(d_str)
+
+
 def _convert_webcal_to_https(url: str) -> str:
     """Convert webcal:// URL to https://."""
     if url.startswith('webcal://'):
@@ -59,31 +91,84 @@ def _convert_webcal_to_https(url: str) -> str:
 class AppleCalendarSync:
     """Sync Apple Calendar (iCloud) appointments to SQLite database."""
     
-    def __init__(self, db_path: str = DB_PATH):
+    def __init__(self, db_path: str = DB_PATH, db: Optional[CalendarDatabase] = None):
         self.db_path = db_path
-        self.db = CalendarDatabase(db_path)
+        self.db = db or get_database(db_path)
+        # Parsed rrules keyed by (RRULE text, series start, window start, cutoff); shared series
+        # (e.g. the same weekly meeting in several calendars) are built once
+        self._rrule_cache: Dict[Tuple[Any, datetime, datetime, datetime], Any] = {}
     
     def _fetch_from_ics_urls(self, urls: List[str], start_date: datetime, cutoff_date: datetime) -> List[Calendar]:
-        """Fetch ICS calendars from URLs."""
-        calendars = []
+        """Fetch ICS calendars from URLs.
+        
+        Downloads run concurrently and revalidate against the cached copy, so
+        wall time is the slowest feed and unchanged feeds return 304 with no body.
+        """
+        # Convert webcal:// to https://
+        urls = [_convert_webcal_to_https(url) for url in urls]
+        if not urls:
+            return []
+        
+        cached = {url: self.db.get_feed_cache(url) for url in urls}
+        
+        with requests.Session() as session:
+            adapter = HTTPAdapter(pool_connections=ICS_FETCH_WORKERS, pool_maxsize=ICS_FETCH_WORKERS)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            with ThreadPoolExecutor(max_workers=min(ICS_FETCH_WORKERS, len(urls))) as executor:
+                results = list(executor.map(lambda url: self._fetch_ics_url(session, url, cached[url]), urls))
         
-        for url in urls:
+        calendars = []
+        for url, result in zip(urls, results):
+            if result is None:
+                continue
+            body, response = result
             try:
-                # Convert webcal:// to https://
-                url = _convert_webcal_to_https(url)
-                
-                logger.info(f"Fetching iCloud calendar from: {url}")
-                response = requests.get(url, timeout=30)
-                response.raise_for_status()
-                
-                calendar = Calendar.from_ical(response.text)
-                calendars.append(calendar)
-                logger.info(f"Successfully fetched calendar from URL")
+                calendar = Calendar.from_ical(body)
             except Exception as e:
-                logger.warning(f"Failed to fetch calendar from {url}: {e}")
+                logger.warning(f"Failed to parse calendar from {url}: {e}")
+                continue
+            calendars.append(calendar)
+            
+            # Remember validators so the next sync can revalidate instead of re-downloading
+            if response is not None:
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                if etag or last_modified:
+                    self.db.save_feed_cache(url, etag, last_modified, body)
         
         return calendars
     
+    def _fetch_ics_url(self, session: requests.Session, url: str, cached: Optional[Dict[str, Any]]):
+        """Download one ICS URL (runs in a worker thread).
+        
+        Returns (body, response), with response None when the cached body was
+        reused after a 304, or None on failure.
+        """
+        try:
+            headers = {}
+            if cached:
+                if cached['etag']:
+                    headers['If-None-Match'] = cached['etag']
+                if cached['last_modified']:
+                    headers['If-Modified-Since'] = cached['last_modified']
+            
+            logger.info(f"Fetching iCloud calendar from: {url}")
+            response = session.get(url, headers=headers, timeout=30)
+            
+            # Unchanged feeds still need re-expanding (the sync window moves), so reuse the cached body
+            if response.status_code == 304 and cached:
+                logger.info("Calendar unchanged since last sync, using cached copy")
+                return cached['body'], None
+            
+            response.raise_for_status()
+            logger.info(f"Successfully fetched calendar from URL")
+            # icalendar parses bytes directly; response.text would add a decoded str copy
+            return response.content, response
+        except Exception as e:
+            logger.warning(f"Failed to fetch calendar from {url}: {e}")
+            return None
+    
     def _load_from_ics_files(self, paths: List[str]) -> List[Calendar]:
         """Load ICS calendars from files."""
         calendars = []
@@ -103,53 +188,37 @@ class AppleCalendarSync:
         return calendars
     
     def _load_from_database(self, db_path: str) -> List[Calendar]:
-        """Load calendars from macOS Calendar.sqlite database (fallback)."""
-        calendars = []
+        """Load calendars from macOS Calendar.sqlite database (fallback).
         
-        try:
-            expanded_path = os.path.expanduser(db_path)
-            if not os.path.exists(expanded_path):
-                logger.warning(f"Calendar database not found: {expanded_path}")
-                return calendars
-            
-            logger.info(f"Loading calendars from database: {expanded_path}")
-            
-            with sqlite3.connect(expanded_path) as conn:
-                cursor = conn.cursor()
-                
-                # Query calendar items
-                cursor.execute('''
-                    SELECT summary, start_date, end_date, location, description, url, all_day
-                    FROM CalendarItem
-                    WHERE start_date IS NOT NULL
-                    ORDER BY start_date
-                ''')
-                
-                # Note: This is a simplified approach. The actual Calendar.sqlite schema is complex.
-                # For production use, prefer ICS URL or ICS file methods.
-                # This method doesn't actually convert to Calendar objects - it's a placeholder.
-            
+        Not implemented: the Calendar.sqlite schema is complex, so this only reports
+        that the fallback is unavailable. Use ICS URL or ICS file methods instead.
+        """
+        expanded_path = os.path.expanduser(db_path)
+        if not os.path.exists(expanded_path):
+            logger.warning(f"Calendar database not found: {expanded_path}")
+        else:
             logger.warning("Direct database access is not fully implemented. Use ICS URL or file methods instead.")
-            
-        except Exception as e:
-            logger.warning(f"Failed to load calendars from database: {e}")
         
-        return calendars
+        return []
     
     def _parse_ics_event(self, event: Event, base_uid: str) -> Optional[Dict[str, Any]]:
-        """Parse ICS event into database record."""
+        """Parse ICS event into database record.
+        
+        ``base_uid`` is the event's UID, read once by the caller.
+        """
+        times = self._extract_times(event)
+        if not times:
+            return None
+        return self._to_record(event, base_uid, *times)
+    
+    def _extract_times(self, event: Event) -> Optional[Tuple[datetime, datetime, bool]]:
+        """Extract (start, end, is_all_day) from an ICS event as aware datetimes.
+        
+        Naive and date-only values are taken as Pacific wall time (date-only at
+        midnight); aware values keep their timezone, which is enough for range
+        checks. Conversion to Pacific happens when the record is formatted.
+        """
         try:
-            uid = str(event.get('UID', ''))
-            if not uid:
-                return None
-            
-            # Use base_uid for recurring events, full uid for single events
-            event_id = base_uid if base_uid != uid else uid
-            
-            # Get subject/summary
-            subject = str(event.get('SUMMARY', ''))
-            
-            # Get start and end times
             dtstart = event.get('DTSTART')
             dtend = event.get('DTEND')
             
@@ -159,29 +228,39 @@ class AppleCalendarSync:
             start_dt = dtstart.dt
             end_dt = dtend.dt
             
-            # Normalize to Pacific timezone (fixes 1-hour offset issue in iCloud ICS feeds)
-            if isinstance(start_dt, datetime):
-                start_dt = normalize_to_pacific(start_dt)
-            if isinstance(end_dt, datetime):
-                end_dt = normalize_to_pacific(end_dt)
-            
             # Handle all-day events
             # All-day events are date-only (not datetime objects)
             is_all_day = not isinstance(start_dt, datetime) or not isinstance(end_dt, datetime)
             
-            if isinstance(start_dt, datetime):
-                start_time = start_dt.isoformat()
-            else:
-                # Date-only (all-day event) - use Pacific timezone with proper DST handling
-                pacific_dt = normalize_to_pacific(datetime.combine(start_dt, datetime.min.time()))
-                start_time = pacific_dt.isoformat()
+            # Use Pacific timezone for date-only and naive values (proper DST handling)
+            if not isinstance(start_dt, datetime):
+                start_dt = pacific_midnight(start_dt)
+            elif start_dt.tzinfo is None:
+                start_dt = normalize_to_pacific(start_dt)
+            if not isinstance(end_dt, datetime):
+                end_dt = pacific_midnight(end_dt)
+            elif end_dt.tzinfo is None:
+                end_dt = normalize_to_pacific(end_dt)
             
-            if isinstance(end_dt, datetime):
-                end_time = end_dt.isoformat()
-            else:
-                # Date-only (all-day event) - use Pacific timezone with proper DST handling
-                pacific_dt = normalize_to_pacific(datetime.combine(end_dt, datetime.min.time()))
-                end_time = pacific_dt.isoformat()
+            return start_dt, end_dt, is_all_day
+        except Exception as e:
+            logger.warning(f"Error parsing ICS event times: {e}")
+            return None
+    
+    def _to_record(self, event: Event, base_uid: str, start_dt: datetime, end_dt: datetime, is_all_day: bool) -> Optional[Dict[str, Any]]:
+        """Build the database record for an ICS event from its extracted times."""
+        try:
+            if not base_uid:
+                return None
+            
+            event_id = base_uid
+            
+            # Get subject/summary
+            subject = str(event.get('SUMMARY', ''))
+            
+            # Normalize to Pacific timezone (fixes 1-hour offset issue in iCloud ICS feeds)
+            start_time = pacific_isoformat(start_dt)
+            end_time = pacific_isoformat(end_dt)
             
             # Get location
             location = str(event.get('LOCATION', ''))
@@ -191,18 +270,22 @@ class AppleCalendarSync:
             organizer_email = ''
             organizer_name = ''
             if organizer:
-                organizer_email = str(organizer).replace('mailto:', '')
-                organizer_name = str(event.get('ORGANIZER', {}).params.get('CN', '')) if hasattr(organizer, 'params') else ''
+                organizer_email = str(organizer)
+                if organizer_email.startswith('mailto:'):
+                    organizer_email = organizer_email[7:]
+                organizer_name = str(organizer.params.get('CN', '')) if hasattr(organizer, 'params') else ''
             
-            # Get attendees
+            # Get attendees (a single ATTENDEE comes back as a bare value, several as a list)
             attendees = []
-            attendee_list = event.get('ATTENDEE', [])
-            if not isinstance(attendee_list, list):
-                attendee_list = [attendee_list]
+            attendee_list = event.get('ATTENDEE') or ()
+            if not isinstance(attendee_list, (list, tuple)):
+                attendee_list = (attendee_list,)
             
             for attendee in attendee_list:
                 if attendee:
-                    attendee_email = str(attendee).replace('mailto:', '')
+                    attendee_email = str(attendee)
+                    if attendee_email.startswith('mailto:'):
+                        attendee_email = attendee_email[7:]
                     if attendee_email:
                         attendees.append(attendee_email)
             
@@ -219,7 +302,7 @@ class AppleCalendarSync:
                 'location': location,
                 'organizer_email': organizer_email,
                 'organizer_name': organizer_name,
-                'attendees': json.dumps(attendees),
+                'attendees': serialize_attendees(tuple(attendees)),
                 'body_preview': body_preview,
                 'is_all_day': 1 if is_all_day else 0,
                 'source': 'apple_calendar'
@@ -228,16 +311,14 @@ class AppleCalendarSync:
             logger.warning(f"Error parsing ICS event: {e}")
             return None
     
-    def _parse_rrule(self, rrule_prop, dtstart: datetime, cutoff_date: datetime):
+    def _parse_rrule(self, rrule_prop, dtstart: datetime, cutoff_date: datetime, window_start: Optional[datetime] = None):
         """Parse RRULE property into a dateutil rrule object.
         
         This method parses vRecur properties directly instead of using rrulestr(),
         which is more robust and handles properties like WKST, UNTIL, INTERVAL, etc.
-        """
-        # Frequency mapping
-        freq_map = {'DAILY': DAILY, 'WEEKLY': WEEKLY, 'MONTHLY': MONTHLY, 'YEARLY': YEARLY}
-        day_map = {'MO': MO, 'TU': TU, 'WE': WE, 'TH': TH, 'FR': FR, 'SA': SA, 'SU': SU}
         
+        If ``window_start`` is given, occurrences before it may be omitted.
+        """
         # Get vRecur as dict if it's a vRecur object
         if hasattr(rrule_prop, 'items'):
             vrec = dict(rrule_prop)
@@ -253,7 +334,7 @@ class AppleCalendarSync:
         if not freq_list:
             return None
         freq_str = freq_list[0] if isinstance(freq_list, list) else freq_list
-        freq = freq_map.get(freq_str)
+        freq = _FREQ_MAP.get(freq_str)
         if not freq:
             return None
         
@@ -270,14 +351,9 @@ class AppleCalendarSync:
         # Until (end date)
         until = vrec.get('UNTIL')
         if until:
-            until_val = until[0] if isinstance(until, list) else until
-            if isinstance(until_val, datetime):
-                if until_val.tzinfo is None:
-                    until_val = until_val.replace(tzinfo=timezone.utc)
-                kwargs['until'] = until_val
-            elif hasattr(until_val, 'date'):
-                # It's a date, convert to datetime
-                kwargs['until'] = datetime.combine(until_val, datetime.max.time()).replace(tzinfo=timezone.utc)
+            until_dt = _until_to_datetime(until)
+            if until_dt:
+                kwargs['until'] = until_dt
         else:
             # No UNTIL specified, use cutoff_date to limit expansion
             kwargs['until'] = cutoff_date
@@ -292,16 +368,10 @@ class AppleCalendarSync:
         if byday:
             byweekday = []
             for d in byday:
-                d_str = str(d).upper()
-                # Handle nth weekday like "1MO" (first Monday)
-                if len(d_str) > 2 and d_str[-2:] in day_map:
-                    n = int(d_str[:-2]) if d_str[:-2].lstrip('-').isdigit() else None
-                    if n:
-                        byweekday.append(day_map[d_str[-2:]](n))
-                    else:
-                        byweekday.append(day_map[d_str[-2:]])
-                elif d_str in day_map:
-                    byweekday.append(day_map[d_str])
+                # Tokens repeat across series ('MO', 'WE', ...), so parsing is cached
+                weekday = _parse_byday_token(str(d))
+                if weekday is not None:
+                    byweekday.append(weekday)
             if byweekday:
                 kwargs['byweekday'] = byweekday
         
@@ -315,18 +385,28 @@ class AppleCalendarSync:
         if bymonth:
             kwargs['bymonth'] = bymonth if isinstance(bymonth, list) else [bymonth]
         
+        # dateutil iterates from dtstart, so an old DAILY/WEEKLY series would step
+        # through years of occurrences before the window. Without COUNT, moving
+        # dtstart forward by whole intervals keeps the same occurrences (and the
+        # same week phase); stop one interval short of the window to stay clear
+        # of DST offset differences.
+        if window_start and freq in (DAILY, WEEKLY) and 'count' not in kwargs and dtstart < window_start:
+            period = timedelta(days=kwargs['interval'] * (7 if freq == WEEKLY else 1))
+            periods = (window_start - dtstart) // period - 1
+            if periods > 0:
+                kwargs['dtstart'] = dtstart + periods * period
+        
         try:
             return rrule(**kwargs)
         except Exception as e:
             logger.warning(f"Failed to create rrule: {e}")
             return None
     
-    def _expand_recurring_event(self, event: Event, start_date: datetime, cutoff_date: datetime) -> List[Dict[str, Any]]:
+    def _expand_recurring_event(self, event: Event, base_uid: str, start_date: datetime, cutoff_date: datetime) -> List[Dict[str, Any]]:
         """Expand recurring event (RRULE) into individual occurrences."""
         occurrences = []
         
         try:
-            base_uid = str(event.get('UID', ''))
             if not base_uid:
                 return occurrences
             
@@ -339,10 +419,12 @@ class AppleCalendarSync:
                 # Normalize to Pacific timezone
                 start_dt = normalize_to_pacific(start_dt)
             else:
-                # Date-only, convert to datetime
-                start_dt = datetime.combine(start_dt, datetime.min.time())
-                # Normalize to Pacific
-                start_dt = normalize_to_pacific(start_dt)
+                # Date-only, convert to midnight Pacific
+                start_dt = pacific_midnight(start_dt)
+            
+            # Series starting after the window cannot produce occurrences in it
+            if start_dt > cutoff_date:
+                return occurrences
             
             # Get duration
             dtend = event.get('DTEND')
@@ -365,13 +447,30 @@ class AppleCalendarSync:
             if not rrule_prop:
                 return occurrences
             
+            # Series that ended before the window cannot produce occurrences in it
+            until = rrule_prop.get('UNTIL') if hasattr(rrule_prop, 'get') else None
+            until_dt = _until_to_datetime(until) if until else None
+            if until_dt and until_dt < start_date:
+                return occurrences
+            
             # Parse RRULE using vRecur properties directly (more robust than rrulestr)
-            try:
-                rule = self._parse_rrule(rrule_prop, start_dt, cutoff_date)
-                if not rule:
-                    return occurrences
-            except Exception as e:
-                logger.warning(f"Failed to parse RRULE: {e}")
+            rrule_text = rrule_prop.to_ical() if hasattr(rrule_prop, 'to_ical') else str(rrule_prop)
+            rrule_key = (rrule_text, start_dt, start_date, cutoff_date)
+            if rrule_key in self._rrule_cache:
+                rule = self._rrule_cache[rrule_key]
+            else:
+                try:
+                    rule = self._parse_rrule(rrule_prop, start_dt, cutoff_date, window_start=start_date)
+                except Exception as e:
+                    logger.warning(f"Failed to parse RRULE: {e}")
+                    rule = None
+                self._rrule_cache[rrule_key] = rule
+            if not rule:
+                return occurrences
+            
+            # Parse the fields shared by every occurrence once, outside the loop
+            base_event_data = self._parse_ics_event(event, base_uid)
+            if not base_event_data:
                 return occurrences
             
             # Generate occurrences
@@ -379,24 +478,22 @@ class AppleCalendarSync:
                 if not isinstance(occurrence_start, datetime):
                     continue
                 
-                # Normalize to Pacific timezone
+                # Normalize to Pacific timezone; the end is derived from the normalized
+                # start, so it is already in Pacific and needs no second conversion
                 occurrence_start = normalize_to_pacific(occurrence_start)
-                occurrence_end_adjusted = normalize_to_pacific(occurrence_start + duration)
+                occurrence_end = occurrence_start + duration
                 
-                # Create event ID with timestamp
-                timestamp = occurrence_start.strftime('%Y%m%dT%H%M%S')
+                # Create event ID with timestamp, taken from the ISO string
+                # ('YYYY-MM-DDTHH:MM:SS...' -> 'YYYYMMDDTHHMMSS'), cheaper than strftime
+                start_time = occurrence_start.isoformat()
+                timestamp = start_time[:19].replace('-', '').replace(':', '')
                 event_id = f"{base_uid}_{timestamp}"
                 
-                # Parse base event to get other fields
-                base_event_data = self._parse_ics_event(event, base_uid)
-                if not base_event_data:
-                    continue
-                
                 # Update with occurrence times
                 occurrence_data = base_event_data.copy()
                 occurrence_data['id'] = event_id
-                occurrence_data['start_time'] = occurrence_start.isoformat()
-                occurrence_data['end_time'] = occurrence_end_adjusted.isoformat()
+                occurrence_data['start_time'] = start_time
+                occurrence_data['end_time'] = occurrence_end.isoformat()
                 
                 occurrences.append(occurrence_data)
             
@@ -438,29 +535,27 @@ class AppleCalendarSync:
             
             # Process all calendars
             for calendar in calendars:
-                for component in calendar.walk():
-                    if component.name == 'VEVENT':
-                        base_uid = str(component.get('UID', ''))
-                        if not base_uid:
-                            continue
-                        
-                        # Check if recurring event
-                        rrule = component.get('RRULE')
-                        
-                        if rrule:
-                            # Expand recurring event
-                            occurrences = self._expand_recurring_event(component, start_date, cutoff_date)
-                            appointments.extend(occurrences)
-                        else:
-                            # Single event
-                            event_data = self._parse_ics_event(component, base_uid)
+                # walk('VEVENT') filters during traversal, skipping VTIMEZONE/VALARM nodes
+                for component in calendar.walk('VEVENT'):
+                    base_uid = str(component.get('UID', ''))
+                    if not base_uid:
+                        continue
+                    
+                    # Check if recurring event
+                    rrule = component.get('RRULE')
+                    
+                    if rrule:
+                        # Expand recurring event
+                        occurrences = self._expand_recurring_event(component, base_uid, start_date, cutoff_date)
+                        appointments.extend(occurrences)
+                    else:
+                        # Single event: range-check the extracted datetimes directly and
+                        # only build records for events inside the window
+                        times = self._extract_times(component)
+                        if times and start_date <= times[0] <= cutoff_date:
+                            event_data = self._to_record(component, base_uid, *times)
                             if event_data:
-                                # Check if event is in date range
-                                start_dt = parse_iso_datetime(event_data['start_time'])
-                                if start_dt:
-                                    start_utc = normalize_to_utc(start_dt)
-                                    if start_date <= start_utc <= cutoff_date:
-                                        appointments.append(event_data)
+                                appointments.append(event_data)
             
             logger.info(f"Parsed {len(appointments)} appointments from Apple Calendar(s)")
             
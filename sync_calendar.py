@@ -6,17 +6,19 @@ Syncs Outlook Calendar appointments using Microsoft Graph API.
 """
 
 import os
-import json
+import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Any, Optional
 from pathlib import Path
+from urllib.parse import urlencode
 
 import msal
 import requests
 from dotenv import load_dotenv
 
-from shared_db import CalendarDatabase
+from shared_db import CalendarDatabase, get_database, serialize_attendees
 from timezone_utils import normalize_to_utc
 
 # Single env file at repo root (LifeSynced/.env.local)
@@ -36,20 +38,36 @@ DB_PATH = os.getenv('DB_PATH', 'calendar.db')
 AUTHORITY = f'https://login.microsoftonline.com/{TENANT_ID}'
 SCOPES = ['Calendars.Read', 'Calendars.Read.Shared']
 GRAPH_ENDPOINT = 'https://graph.microsoft.com/v1.0'
+TOKEN_CACHE_FILE = Path('.token_cache.json')
+# Re-acquire the access token once it has less than this many seconds left
+TOKEN_REFRESH_MARGIN = 300
+# Display times in Pacific (same as the other calendar sources)
+PREFER_TIMEZONE = 'outlook.timezone="America/Los_Angeles"'
+
+# JSON batching: Graph accepts at most 20 subrequests per $batch call
+BATCH_MAX_REQUESTS = 20
+BATCH_BUCKET_DAYS = 7
 
 
 def load_token_cache() -> msal.SerializableTokenCache:
     """Load token cache from file."""
     cache = msal.SerializableTokenCache()
-    cache_file = Path('.token_cache.json')
-    if cache_file.exists():
-        cache.deserialize(cache_file.read_text())
+    if TOKEN_CACHE_FILE.exists():
+        cache.deserialize(TOKEN_CACHE_FILE.read_text())
     return cache
 
 
 def save_token_cache(cache: msal.SerializableTokenCache) -> None:
-    """Save token cache to file."""
-    Path('.token_cache.json').write_text(cache.serialize())
+    """Save token cache to file if MSAL changed it.
+    
+    Written to a temporary file and renamed into place, so a concurrent sync
+    never reads a half-written cache.
+    """
+    if not cache.has_state_changed:
+        return
+    tmp_file = TOKEN_CACHE_FILE.with_name(f'{TOKEN_CACHE_FILE.name}.{os.getpid()}.tmp')
+    tmp_file.write_text(cache.serialize())
+    os.replace(tmp_file, TOKEN_CACHE_FILE)
 
 
 def acquire_token_interactive(app: msal.PublicClientApplication) -> Optional[Dict[str, Any]]:
@@ -72,14 +90,36 @@ def acquire_token_interactive(app: msal.PublicClientApplication) -> Optional[Dic
 class CalendarSync:
     """Sync Outlook calendar appointments to SQLite database."""
     
-    def __init__(self, db_path: str = DB_PATH):
+    def __init__(self, db_path: str = DB_PATH, db: Optional[CalendarDatabase] = None):
         self.db_path = db_path
-        self.db = CalendarDatabase(db_path)
+        self.db = db or get_database(db_path)
         self.app = msal.PublicClientApplication(
             CLIENT_ID,
             authority=AUTHORITY,
             token_cache=load_token_cache()
         )
+        self._access_token: Optional[str] = None
+        self._token_expires_at = 0.0
+    
+    def _get_access_token(self) -> Optional[str]:
+        """Acquire a Graph access token (silently when cached) and persist the token cache.
+        
+        The token is kept on the instance and reused until it is within
+        TOKEN_REFRESH_MARGIN seconds of expiry.
+        """
+        if self._access_token and self._token_expires_at - time.time() > TOKEN_REFRESH_MARGIN:
+            return self._access_token
+        
+        token_result = acquire_token_interactive(self.app)
+        if not token_result or 'access_token' not in token_result:
+            error = token_result.get('error_description', 'Unknown error') if token_result else 'Unknown error'
+            logger.error(f"Failed to acquire token: {error}")
+            return None
+        
+        save_token_cache(self.app.token_cache)
+        self._access_token = token_result['access_token']
+        self._token_expires_at = time.time() + int(token_result.get('expires_in', 0))
+        return self._access_token
     
     def _fetch_appointments(self, start_date: Optional[datetime] = None, 
                            end_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
@@ -89,19 +129,14 @@ class CalendarSync:
         if not end_date:
             end_date = start_date + timedelta(days=30)
         
-        # Acquire token
-        token_result = acquire_token_interactive(self.app)
-        if not token_result or 'access_token' not in token_result:
-            error = token_result.get('error_description', 'Unknown error')
-            logger.error(f"Failed to acquire token: {error}")
+        access_token = self._get_access_token()
+        if not access_token:
             return []
         
-        save_token_cache(self.app.token_cache)
-        
         # Fetch calendar events
         headers = {
-            'Authorization': f"Bearer {token_result['access_token']}",
-            'Prefer': 'outlook.timezone="America/Los_Angeles"'
+            'Authorization': f"Bearer {access_token}",
+            'Prefer': PREFER_TIMEZONE
         }
         
         start_str = start_date.strftime('%Y-%m-%dT%H:%M:%SZ')
@@ -116,24 +151,102 @@ class CalendarSync:
         }
         
         all_appointments = []
-        while url:
-            response = requests.get(url, headers=headers, params=params)
-            params = None  # Only use params for first request
-            
-            if response.status_code != 200:
-                logger.error(f"Failed to fetch calendar: {response.status_code} - {response.text}")
-                break
+        # One keep-alive session for all pages; each nextLink is requested before the
+        # current page is parsed, so parsing overlaps the next round trip
+        with requests.Session() as session, ThreadPoolExecutor(max_workers=1) as executor:
+            session.headers.update(headers)
+            response = session.get(url, params=params)
             
-            data = response.json()
-            events = data.get('value', [])
-            
-            for event in events:
-                parsed = self._parse_appointment(event)
-                if parsed:
-                    all_appointments.append(parsed)
+            while response is not None:
+                if response.status_code != 200:
+                    logger.error(f"Failed to fetch calendar: {response.status_code} - {response.text}")
+                    break
+                
+                data = response.json()
+                
+                # Check for next page
+                next_link = data.get('@odata.nextLink')
+                next_response = executor.submit(session.get, next_link) if next_link else None
+                
+                events = data.get('value', [])
+                
+                for event in events:
+                    parsed = self._parse_appointment(event)
+                    if parsed:
+                        all_appointments.append(parsed)
+                
+                response = next_response.result() if next_response else None
+        
+        return all_appointments
+    
+    def _fetch_appointments_batched(self, start_date: datetime, end_date: datetime) -> Optional[List[Dict[str, Any]]]:
+        """Fetch appointments with Graph JSON batching.
+        
+        The range is split into weekly calendarView requests sent up to 20 per
+        POST /$batch; nextLinks go into follow-up batches. Returns None if a batch
+        or subrequest fails, so the caller can fall back to _fetch_appointments.
+        """
+        access_token = self._get_access_token()
+        if not access_token:
+            return []
+        
+        # Weekly sub-ranges; subrequest URLs are relative to the API version root
+        request_urls = []
+        bucket_start = start_date
+        while bucket_start < end_date:
+            bucket_end = min(bucket_start + timedelta(days=BATCH_BUCKET_DAYS), end_date)
+            query = urlencode({
+                'startDateTime': bucket_start.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                'endDateTime': bucket_end.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                '$orderby': 'start/dateTime',
+                '$top': 1000
+            }, safe='$/:')
+            request_urls.append(f'/me/calendar/calendarView?{query}')
+            bucket_start = bucket_end
+        
+        events = []
+        seen_ids = set()
+        with requests.Session() as session:
+            session.headers['Authorization'] = f"Bearer {access_token}"
             
-            # Check for next page
-            url = data.get('@odata.nextLink')
+            while request_urls:
+                chunk = request_urls[:BATCH_MAX_REQUESTS]
+                request_urls = request_urls[BATCH_MAX_REQUESTS:]
+                
+                response = session.post(f'{GRAPH_ENDPOINT}/$batch', json={
+                    'requests': [
+                        {'id': str(i), 'method': 'GET', 'url': url, 'headers': {'Prefer': PREFER_TIMEZONE}}
+                        for i, url in enumerate(chunk)
+                    ]
+                })
+                if response.status_code != 200:
+                    logger.warning(f"Graph batch request failed: {response.status_code} - {response.text}")
+                    return None
+                
+                # Responses may arrive in any order; keep request (chronological) order
+                for sub_response in sorted(response.json().get('responses', []), key=lambda r: int(r['id'])):
+                    if sub_response.get('status') != 200:
+                        logger.warning(f"Graph batch subrequest failed: {sub_response.get('status')}")
+                        return None
+                    
+                    body = sub_response.get('body') or {}
+                    for event in body.get('value', []):
+                        # Events spanning a bucket boundary are returned by both buckets
+                        event_id = event.get('id')
+                        if event_id in seen_ids:
+                            continue
+                        seen_ids.add(event_id)
+                        events.append(event)
+                    
+                    next_link = body.get('@odata.nextLink')
+                    if next_link:
+                        request_urls.append(next_link[len(GRAPH_ENDPOINT):] if next_link.startswith(GRAPH_ENDPOINT) else next_link)
+        
+        all_appointments = []
+        for event in events:
+            parsed = self._parse_appointment(event)
+            if parsed:
+                all_appointments.append(parsed)
         
         return all_appointments
     
@@ -145,23 +258,25 @@ class CalendarSync:
         start_time = event.get('start', {}).get('dateTime', '')
         end_time = event.get('end', {}).get('dateTime', '')
         
-        # Calculate duration to detect multi-day events
-        is_multi_day = False
-        if start_time and end_time:
-            try:
-                from dateutil import parser
-                start_dt = parser.isoparse(start_time)
-                end_dt = parser.isoparse(end_time)
-                duration_hours = (end_dt - start_dt).total_seconds() / 3600
-                is_multi_day = duration_hours >= 24
-            except Exception:
-                pass
-        
         # Skip all-day or multi-day "Free" events from work calendar
-        # These clutter the calendar and shouldn't trigger overlap detection
-        if subject == 'Free' and (is_all_day or is_multi_day):
-            logger.debug(f"Skipping all-day/multi-day Free event: {event.get('id', '')}")
-            return None
+        # These clutter the calendar and shouldn't trigger overlap detection.
+        # The duration only matters for timed "Free" events, and two times on the
+        # same date (same Prefer'd timezone) are always under 24h apart.
+        if subject == 'Free':
+            is_multi_day = False
+            if not is_all_day and start_time and end_time and start_time[:10] != end_time[:10]:
+                try:
+                    # Graph returns 7 fractional digits; fromisoformat (before 3.11) accepts
+                    # at most 6, and both times share the Prefer'd timezone
+                    start_dt = datetime.fromisoformat(start_time[:26])
+                    end_dt = datetime.fromisoformat(end_time[:26])
+                    is_multi_day = (end_dt - start_dt).days >= 1
+                except ValueError:
+                    pass
+            
+            if is_all_day or is_multi_day:
+                logger.debug(f"Skipping all-day/multi-day Free event: {event.get('id', '')}")
+                return None
         
         organizer = event.get('organizer', {})
         organizer_email = organizer.get('emailAddress', {}).get('address', '')
@@ -182,7 +297,7 @@ class CalendarSync:
             'location': event.get('location', {}).get('displayName', '') if isinstance(event.get('location'), dict) else event.get('location', ''),
             'organizer_email': organizer_email,
             'organizer_name': organizer_name,
-            'attendees': json.dumps(attendee_emails),
+            'attendees': serialize_attendees(tuple(attendee_emails)),
             'body_preview': event.get('bodyPreview', ''),
             'is_all_day': 1 if is_all_day else 0,
             'source': 'graph_api'
@@ -196,7 +311,17 @@ class CalendarSync:
             start_date = datetime.now(timezone.utc) - timedelta(days=days_back)
             end_date = datetime.now(timezone.utc) + timedelta(days=days_forward)
             
-            appointments = self._fetch_appointments(start_date, end_date)
+            # A range spanning several buckets is fetched in batches; a single bucket
+            # (or a failed batch) uses the paged calendarView request
+            appointments = None
+            if end_date - start_date > timedelta(days=BATCH_BUCKET_DAYS):
+                appointments = self._fetch_appointments_batched(start_date, end_date)
+            if appointments is None:
+                appointments = self._fetch_appointments(start_date, end_date)
+            
+            # One row per id before the batch save; a later copy of an id replaces an
+            # earlier one (the position of the first is kept)
+            appointments = list({a['id']: a for a in appointments}.values())
             logger.info(f"Fetched {len(appointments)} appointments from Graph API")
             
             if appointments:
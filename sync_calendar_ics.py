@@ -7,19 +7,22 @@ This method requires publishing your calendar in Outlook on the Web.
 """
 
 import os
-import json
+import itertools
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
 
 import requests
-from icalendar import Calendar, Event
+from icalendar import Event
+from icalendar.cal import Component
 from icalendar.prop import vRecur
 from dateutil.rrule import rrule, DAILY, WEEKLY, MONTHLY, YEARLY, MO, TU, WE, TH, FR, SA, SU
 from dotenv import load_dotenv
 
-from shared_db import CalendarDatabase
-from timezone_utils import get_date_range, normalize_to_utc, parse_iso_datetime
+from shared_db import CalendarDatabase, get_database, serialize_attendees
+from timezone_utils import get_date_range
 from pathlib import Path
 
 # Single env file at repo root (LifeSynced/.env.local)
@@ -38,55 +41,271 @@ DB_PATH = os.getenv('DB_PATH', 'calendar.db')
 # Status words that indicate availability-only (not actual event titles)
 STATUS_WORDS = {'Free', 'Busy', 'Tentative', 'Out of Office', 'Working Elsewhere'}
 
+# RRULE FREQ / BYDAY values to dateutil constants
+_FREQ_MAP = {'DAILY': DAILY, 'WEEKLY': WEEKLY, 'MONTHLY': MONTHLY, 'YEARLY': YEARLY}
+_DAY_MAP = {'MO': MO, 'TU': TU, 'WE': WE, 'TH': TH, 'FR': FR, 'SA': SA, 'SU': SU}
+
+# The first PARSE_PROCESS_MIN_EVENTS VEVENTs of a feed are parsed in-process;
+# the rest of a larger feed goes to a process pool in chunks of PARSE_CHUNK_EVENTS
+PARSE_PROCESS_MIN_EVENTS = 1000
+PARSE_CHUNK_EVENTS = 200
+
+# Top-level components split out of the streamed feed (BEGIN line -> END line)
+_BLOCK_ENDS = {b'BEGIN:VEVENT': b'END:VEVENT', b'BEGIN:VTIMEZONE': b'END:VTIMEZONE'}
+
+
+def _as_first(value):
+    """Unwrap a single-valued vRecur part, which icalendar returns as a list."""
+    return value[0] if isinstance(value, list) else value
+
+
+def _prop(component: Component, name: str, default: str = '') -> str:
+    """Text of a component property, or default if absent.
+    
+    str() of the value gives the unescaped text (to_ical() would re-escape it).
+    """
+    value = component.get(name)
+    return default if value is None else str(value)
+
+
+def _iter_component_blocks(lines: Iterable[bytes]) -> Iterator[bytes]:
+    """Split ICS content lines into the raw text of each VEVENT/VTIMEZONE block.
+    
+    Only BEGIN/END lines are inspected; folded continuation lines start with
+    whitespace, so they are never mistaken for block boundaries.
+    """
+    block = None
+    end = None
+    for line in lines:
+        if not line:
+            continue
+        if block is None:
+            end = _BLOCK_ENDS.get(line.rstrip().upper())
+            if end:
+                block = [line]
+        else:
+            block.append(line)
+            if line[:4].upper() == b'END:' and line.rstrip().upper() == end:
+                yield b'\r\n'.join(block)
+                block = None
+
+
+def _parse_event_blocks(vtimezone_blocks: Tuple[bytes, ...], vevent_blocks: List[bytes],
+                        start_date: datetime, cutoff_date: datetime) -> List[Dict[str, Any]]:
+    """Process-pool worker: turn raw VEVENT blocks into appointment records.
+    
+    The VTIMEZONE blocks go first so TZID references resolve in this process the
+    same way they do in the parent; all blocks share _iter_events' skip-on-error
+    parsing.
+    """
+    parser = CalendarSyncICS()
+    blocks = itertools.chain(vtimezone_blocks, vevent_blocks)
+    return parser._process_events(parser._iter_events(blocks), start_date, cutoff_date)
+
 
 class CalendarSyncICS:
     """Sync Outlook calendar appointments from ICS feed to SQLite database."""
     
-    def __init__(self, db_path: str = DB_PATH):
+    def __init__(self, db_path: str = DB_PATH, db: Optional[CalendarDatabase] = None):
         self.db_path = db_path
-        self.db = CalendarDatabase(db_path)
+        # Opened on first use, so parse-only instances (pool workers) never open it
+        self._db = db
+        # Parsed rrules keyed by (RRULE text, series start, its zone, cutoff); series
+        # with the same rule and start (e.g. a recurring slot booked for several
+        # meetings) are built once
+        self._rrule_cache: Dict[Tuple[Any, datetime, Any, datetime], Any] = {}
     
-    def _fetch_ics(self, url: str) -> Optional[Calendar]:
-        """Fetch ICS calendar from URL."""
+    @property
+    def db(self) -> CalendarDatabase:
+        if self._db is None:
+            self._db = get_database(self.db_path)
+        return self._db
+    
+    def _fetch_ics(self, url: str, cached: Optional[Dict[str, Any]] = None) -> Optional[requests.Response]:
+        """Fetch ICS calendar from URL as a streamed response.
+        
+        With a cached copy the request is conditional, and a 304 response is
+        returned as-is so the caller can reuse the cached body.
+        """
         try:
+            headers = {}
+            if cached:
+                if cached['etag']:
+                    headers['If-None-Match'] = cached['etag']
+                if cached['last_modified']:
+                    headers['If-Modified-Since'] = cached['last_modified']
+            
             logger.info(f"Fetching ICS feed from: {url}")
-            response = requests.get(url, timeout=30)
+            response = requests.get(url, headers=headers, timeout=30, stream=True)
+            if response.status_code == 304 and cached:
+                return response
             response.raise_for_status()
             
-            calendar = Calendar.from_ical(response.text)
             logger.info(f"Successfully fetched ICS calendar")
-            return calendar
+            return response
         except Exception as e:
             logger.error(f"Failed to fetch ICS feed: {e}")
             return None
     
-    def _parse_ics_event(self, event: Event, base_uid: str) -> Optional[Dict[str, Any]]:
-        """Parse ICS event into database record."""
-        try:
-            uid = str(event.get('UID', ''))
-            if not uid:
-                return None
+    def _iter_feed_lines(self, url: str, response: requests.Response) -> Iterator[bytes]:
+        """Yield the lines of a streamed feed, caching the body once fully read.
+        
+        The body is only kept when the server sent validators to revalidate with.
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not (etag or last_modified):
+            yield from response.iter_lines(chunk_size=65536)
+            return
+        
+        # One growing buffer (no per-line objects kept, no final join copy)
+        body = bytearray()
+        for line in response.iter_lines(chunk_size=65536):
+            body += line
+            body += b'\r\n'
+            yield line
+        
+        # Remember validators so the next sync can revalidate instead of re-downloading
+        self.db.save_feed_cache(url, etag, last_modified, body)
+    
+    def _iter_events(self, blocks: Iterable[bytes]) -> Iterator[Event]:
+        """Parse VEVENT/VTIMEZONE blocks one at a time, yielding the events.
+        
+        With blocks split from a streamed response, the feed is never held in
+        memory as a whole and parsing overlaps the transfer. Each VTIMEZONE is
+        parsed as it arrives, which registers it with icalendar so TZID references
+        in the events that follow resolve (Outlook publishes its VTIMEZONEs before
+        any VEVENT).
+        """
+        for block in blocks:
+            try:
+                component = Component.from_ical(block)
+            except Exception as e:
+                logger.warning(f"Skipping unparsable ICS component: {e}")
+                continue
+            if component.name == 'VEVENT':
+                yield component
+    
+    def _process_events(self, events: Iterable[Event], start_date: datetime, cutoff_date: datetime) -> List[Dict[str, Any]]:
+        """Build appointment records for events in the date range, expanding recurrences."""
+        # Range-check single events on POSIX timestamps, computed once
+        start_ts = start_date.timestamp()
+        cutoff_ts = cutoff_date.timestamp()
+        
+        appointments = []
+        
+        for component in events:
+            base_uid = _prop(component, 'UID')
+            if not base_uid:
+                continue
             
-            # Use base_uid for recurring events, full uid for single events
-            event_id = base_uid if base_uid != uid else uid
+            # Look up the properties used below once and pass them on
+            dtstart = component.get('DTSTART')
+            dtend = component.get('DTEND')
             
-            # Get subject/summary
-            subject = str(event.get('SUMMARY', ''))
+            # Check if recurring event
+            rrule = component.get('RRULE')
             
-            # Handle status words (availability-only events)
-            if subject in STATUS_WORDS:
-                # Try to use DESCRIPTION as subject
-                description = str(event.get('DESCRIPTION', ''))
-                if description and description not in STATUS_WORDS and len(description.strip()) > 0:
-                    subject = description
+            if rrule:
+                # Expand recurring event
+                occurrences = self._expand_recurring_event(component, base_uid, dtstart, dtend, rrule, start_date, cutoff_date)
+                appointments.extend(occurrences)
+            else:
+                # Single event: check the date range before building the record
+                times = self._extract_times(dtstart, dtend)
+                if times and start_ts <= times[0].timestamp() <= cutoff_ts:
+                    event_data = self._to_record(component, base_uid, *times)
+                    if event_data:
+                        appointments.append(event_data)
+        
+        return appointments
+    
+    def _process_blocks(self, blocks: Iterable[bytes], start_date: datetime, cutoff_date: datetime) -> List[Dict[str, Any]]:
+        """Parse and expand a feed's VEVENT blocks as they stream in.
+        
+        The first PARSE_PROCESS_MIN_EVENTS events are handled in this process. If
+        the feed has more, the rest are spread across worker processes, so the
+        choice depends on what was actually read rather than on Content-Length
+        (absent for chunked responses, compressed size for gzip ones).
+        """
+        blocks = iter(blocks)
+        vtimezone_blocks = []
+        
+        def head() -> Iterator[bytes]:
+            count = 0
+            for block in blocks:
+                if block[:15].upper() == b'BEGIN:VTIMEZONE':
+                    vtimezone_blocks.append(block)
                 else:
-                    # Prefix status word with brackets
-                    subject = f"[{subject}]"
-            
-            # Get start and end times
-            dtstart = event.get('DTSTART')
-            dtend = event.get('DTEND')
+                    count += 1
+                yield block
+                if count >= PARSE_PROCESS_MIN_EVENTS:
+                    return
+        
+        appointments = self._process_events(self._iter_events(head()), start_date, cutoff_date)
+        
+        first = next(blocks, None)
+        if first is not None:
+            appointments.extend(self._process_blocks_in_pool(
+                itertools.chain((first,), blocks), vtimezone_blocks, start_date, cutoff_date
+            ))
+        return appointments
+    
+    def _process_blocks_in_pool(self, blocks: Iterable[bytes], vtimezone_blocks: List[bytes],
+                                start_date: datetime, cutoff_date: datetime) -> List[Dict[str, Any]]:
+        """Parse and expand VEVENT blocks across worker processes.
+        
+        Chunks are submitted while the feed is still downloading; each carries the
+        VTIMEZONE blocks seen so far. Results keep feed order. Workers are spawned
+        rather than forked: sync_all runs this sync in a thread, and forking a
+        multithreaded process can copy locks held by other threads. A chunk whose
+        worker fails is redone in this process, so errors surface as they would
+        on the serial path.
+        """
+        vtimezone_blocks = list(vtimezone_blocks)
+        chunk = []
+        futures = []
+        with ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn')) as executor:
+            for block in blocks:
+                if block[:15].upper() == b'BEGIN:VTIMEZONE':
+                    vtimezone_blocks.append(block)
+                    continue
+                chunk.append(block)
+                if len(chunk) >= PARSE_CHUNK_EVENTS:
+                    args = (tuple(vtimezone_blocks), chunk, start_date, cutoff_date)
+                    futures.append((executor.submit(_parse_event_blocks, *args), args))
+                    chunk = []
+            if chunk:
+                args = (tuple(vtimezone_blocks), chunk, start_date, cutoff_date)
+                futures.append((executor.submit(_parse_event_blocks, *args), args))
             
+            appointments = []
+            for future, args in futures:
+                try:
+                    appointments.extend(future.result())
+                except Exception as e:
+                    logger.warning(f"ICS parse worker failed ({e}), parsing its events in-process")
+                    appointments.extend(_parse_event_blocks(*args))
+        
+        return appointments
+    
+    def _parse_ics_event(self, event: Event, base_uid: str, dtstart, dtend) -> Optional[Dict[str, Any]]:
+        """Parse ICS event into database record.
+        
+        ``base_uid``, ``dtstart`` and ``dtend`` are the event's UID, DTSTART and
+        DTEND properties, read once by the caller.
+        """
+        times = self._extract_times(dtstart, dtend)
+        if not times:
+            return None
+        return self._to_record(event, base_uid, *times)
+    
+    def _extract_times(self, dtstart, dtend) -> Optional[Tuple[datetime, datetime, bool]]:
+        """Extract (start, end, is_all_day) from DTSTART/DTEND properties as aware datetimes.
+        
+        Naive values are taken as UTC and date-only values as UTC midnight.
+        """
+        try:
             if not dtstart or not dtend:
                 return None
             
@@ -97,67 +316,88 @@ class CalendarSyncICS:
             # All-day events are date-only (not datetime objects)
             is_all_day = not isinstance(start_dt, datetime) or not isinstance(end_dt, datetime)
             
-            # Calculate duration to detect multi-day events
-            if isinstance(start_dt, datetime) and isinstance(end_dt, datetime):
-                duration_hours = (end_dt - start_dt).total_seconds() / 3600
-            else:
-                # For date-only events, calculate days difference
-                from datetime import date
-                if isinstance(start_dt, date) and isinstance(end_dt, date):
-                    duration_hours = (end_dt - start_dt).days * 24
-                else:
-                    duration_hours = 24  # Assume at least 1 day
-            
-            is_multi_day = duration_hours >= 24
-            
-            # Skip all-day or multi-day [Free] events from work calendar
-            # These clutter the calendar and shouldn't trigger overlap detection
-            if subject == '[Free]' and (is_all_day or is_multi_day):
-                logger.debug(f"Skipping all-day/multi-day [Free] event: {uid}")
-                return None
-            
             if isinstance(start_dt, datetime):
                 # Ensure timezone-aware
                 if start_dt.tzinfo is None:
                     start_dt = start_dt.replace(tzinfo=timezone.utc)
-                start_time = start_dt.isoformat()
             else:
                 # Date-only (all-day event)
-                start_time = start_dt.isoformat() + 'T00:00:00+00:00'
+                start_dt = datetime.combine(start_dt, datetime.min.time(), tzinfo=timezone.utc)
             
             if isinstance(end_dt, datetime):
                 if end_dt.tzinfo is None:
                     end_dt = end_dt.replace(tzinfo=timezone.utc)
-                end_time = end_dt.isoformat()
             else:
                 # Date-only (all-day event)
-                end_time = end_dt.isoformat() + 'T00:00:00+00:00'
+                end_dt = datetime.combine(end_dt, datetime.min.time(), tzinfo=timezone.utc)
+            
+            return start_dt, end_dt, is_all_day
+        except Exception as e:
+            logger.warning(f"Error parsing ICS event times: {e}")
+            return None
+    
+    def _to_record(self, event: Event, base_uid: str, start_dt: datetime, end_dt: datetime, is_all_day: bool) -> Optional[Dict[str, Any]]:
+        """Build the database record for an ICS event from its extracted times."""
+        try:
+            if not base_uid:
+                return None
+            
+            # Recurring occurrences get their own ids from the caller
+            event_id = base_uid
+            
+            # Get subject/summary
+            subject = _prop(event, 'SUMMARY')
+            description = _prop(event, 'DESCRIPTION')
+            
+            # Handle status words (availability-only events)
+            if subject in STATUS_WORDS:
+                # Try to use DESCRIPTION as subject
+                if description and description not in STATUS_WORDS and len(description.strip()) > 0:
+                    subject = description
+                else:
+                    # Prefix status word with brackets
+                    subject = f"[{subject}]"
+            
+            # Skip all-day or multi-day [Free] events from work calendar
+            # These clutter the calendar and shouldn't trigger overlap detection.
+            # This runs before any other property is read, and the duration is
+            # only needed for timed [Free] events.
+            if subject == '[Free]' and (is_all_day or (end_dt - start_dt).total_seconds() >= 24 * 3600):
+                logger.debug(f"Skipping all-day/multi-day [Free] event: {base_uid}")
+                return None
+            
+            start_time = start_dt.isoformat()
+            end_time = end_dt.isoformat()
             
             # Get location
-            location = str(event.get('LOCATION', ''))
+            location = _prop(event, 'LOCATION')
             
             # Get organizer
             organizer = event.get('ORGANIZER', '')
             organizer_email = ''
             organizer_name = ''
             if organizer:
-                organizer_email = str(organizer).replace('mailto:', '')
-                organizer_name = str(event.get('ORGANIZER', {}).params.get('CN', '')) if hasattr(organizer, 'params') else ''
+                organizer_email = str(organizer)
+                if organizer_email.startswith('mailto:'):
+                    organizer_email = organizer_email[7:]
+                organizer_name = str(organizer.params.get('CN', '')) if hasattr(organizer, 'params') else ''
             
-            # Get attendees
+            # Get attendees (a single ATTENDEE comes back as a bare value, several as a list)
             attendees = []
-            attendee_list = event.get('ATTENDEE', [])
-            if not isinstance(attendee_list, list):
-                attendee_list = [attendee_list]
+            attendee_list = event.get('ATTENDEE') or ()
+            if not isinstance(attendee_list, (list, tuple)):
+                attendee_list = (attendee_list,)
             
             for attendee in attendee_list:
                 if attendee:
-                    attendee_email = str(attendee).replace('mailto:', '')
+                    attendee_email = str(attendee)
+                    if attendee_email.startswith('mailto:'):
+                        attendee_email = attendee_email[7:]
                     if attendee_email:
                         attendees.append(attendee_email)
             
             # Get description/body
-            body_preview = str(event.get('DESCRIPTION', ''))
+            body_preview = description
             if len(body_preview) > 500:
                 body_preview = body_preview[:500] + '...'
             
@@ -169,7 +409,7 @@ class CalendarSyncICS:
                 'location': location,
                 'organizer_email': organizer_email,
                 'organizer_name': organizer_name,
-                'attendees': json.dumps(attendees),
+                'attendees': serialize_attendees(tuple(attendees)),
                 'body_preview': body_preview,
                 'is_all_day': 1 if is_all_day else 0,
                 'source': 'ics'
@@ -184,10 +424,6 @@ class CalendarSyncICS:
         This method parses vRecur properties directly instead of using rrulestr(),
         which is more robust and handles properties like WKST, UNTIL, INTERVAL, etc.
         """
-        # Frequency mapping
-        freq_map = {'DAILY': DAILY, 'WEEKLY': WEEKLY, 'MONTHLY': MONTHLY, 'YEARLY': YEARLY}
-        day_map = {'MO': MO, 'TU': TU, 'WE': WE, 'TH': TH, 'FR': FR, 'SA': SA, 'SU': SU}
-        
         # Get vRecur as dict if it's a vRecur object
         if hasattr(rrule_prop, 'items'):
             vrec = dict(rrule_prop)
@@ -202,8 +438,7 @@ class CalendarSyncICS:
         freq_list = vrec.get('FREQ', [])
         if not freq_list:
             return None
-        freq_str = freq_list[0] if isinstance(freq_list, list) else freq_list
-        freq = freq_map.get(freq_str)
+        freq = _FREQ_MAP.get(_as_first(freq_list))
         if not freq:
             return None
         
@@ -214,13 +449,12 @@ class CalendarSyncICS:
         }
         
         # Interval
-        interval = vrec.get('INTERVAL', [1])
-        kwargs['interval'] = interval[0] if isinstance(interval, list) else interval
+        kwargs['interval'] = _as_first(vrec.get('INTERVAL', [1]))
         
         # Until (end date)
         until = vrec.get('UNTIL')
         if until:
-            until_val = until[0] if isinstance(until, list) else until
+            until_val = _as_first(until)
             if isinstance(until_val, datetime):
                 if until_val.tzinfo is None:
                     until_val = until_val.replace(tzinfo=timezone.utc)
@@ -235,7 +469,7 @@ class CalendarSyncICS:
         # Count (number of occurrences)
         count = vrec.get('COUNT')
         if count:
-            kwargs['count'] = count[0] if isinstance(count, list) else count
+            kwargs['count'] = _as_first(count)
         
         # BYDAY (specific days of week)
         byday = vrec.get('BYDAY', [])
@@ -244,14 +478,14 @@ class CalendarSyncICS:
             for d in byday:
                 d_str = str(d).upper()
                 # Handle nth weekday like "1MO" (first Monday)
-                if len(d_str) > 2 and d_str[-2:] in day_map:
+                if len(d_str) > 2 and d_str[-2:] in _DAY_MAP:
                     n = int(d_str[:-2]) if d_str[:-2].lstrip('-').isdigit() else None
                     if n:
-                        byweekday.append(day_map[d_str[-2:]](n))
+                        byweekday.append(_DAY_MAP[d_str[-2:]](n))
                     else:
-                        byweekday.append(day_map[d_str[-2:]])
-                elif d_str in day_map:
-                    byweekday.append(day_map[d_str])
+                        byweekday.append(_DAY_MAP[d_str[-2:]])
+                elif d_str in _DAY_MAP:
+                    byweekday.append(_DAY_MAP[d_str])
             if byweekday:
                 kwargs['byweekday'] = byweekday
         
@@ -271,16 +505,19 @@ class CalendarSyncICS:
             logger.warning(f"Failed to create rrule: {e}")
             return None
     
-    def _expand_recurring_event(self, event: Event, start_date: datetime, cutoff_date: datetime) -> List[Dict[str, Any]]:
-        """Expand recurring event (RRULE) into individual occurrences."""
+    def _expand_recurring_event(self, event: Event, base_uid: str, dtstart, dtend, rrule_prop,
+                                start_date: datetime, cutoff_date: datetime) -> List[Dict[str, Any]]:
+        """Expand recurring event (RRULE) into individual occurrences.
+        
+        ``base_uid``, ``dtstart``, ``dtend`` and ``rrule_prop`` are the event's
+        UID, DTSTART, DTEND and RRULE properties, read once by the caller.
+        """
         occurrences = []
         
         try:
-            base_uid = str(event.get('UID', ''))
             if not base_uid:
                 return occurrences
             
-            dtstart = event.get('DTSTART')
             if not dtstart:
                 return occurrences
             
@@ -293,7 +530,6 @@ class CalendarSyncICS:
                 start_dt = datetime.combine(start_dt, datetime.min.time()).replace(tzinfo=timezone.utc)
             
             # Get duration
-            dtend = event.get('DTEND')
             duration = None
             if dtend:
                 end_dt = dtend.dt
@@ -308,19 +544,31 @@ class CalendarSyncICS:
             if not duration:
                 duration = timedelta(hours=1)  # Default 1 hour
             
-            # Get RRULE
-            rrule_prop = event.get('RRULE')
             if not rrule_prop:
                 return occurrences
             
             # Parse RRULE using vRecur properties directly (more robust than rrulestr)
-            try:
-                rule = self._parse_rrule(rrule_prop, start_dt, cutoff_date)
-                if not rule:
-                    return occurrences
-            except Exception as e:
-                logger.warning(f"Failed to parse RRULE: {e}")
+            rrule_text = rrule_prop.to_ical() if hasattr(rrule_prop, 'to_ical') else str(rrule_prop)
+            # Aware datetimes naming the same instant compare equal across zones, but the
+            # rule repeats in the series' own zone, so the zone is part of the key
+            rrule_key = (rrule_text, start_dt, start_dt.tzinfo, cutoff_date)
+            if rrule_key in self._rrule_cache:
+                rule = self._rrule_cache[rrule_key]
+            else:
+                try:
+                    rule = self._parse_rrule(rrule_prop, start_dt, cutoff_date)
+                except Exception as e:
+                    logger.warning(f"Failed to parse RRULE: {e}")
+                    rule = None
+                self._rrule_cache[rrule_key] = rule
+            if not rule:
+                return occurrences
+            
+            # Parse the fields shared by every occurrence once, outside the loop
+            base_event_data = self._parse_ics_event(event, base_uid, dtstart, dtend)
+            if not base_event_data:
                 return occurrences
+            base_uid_prefix = f"{base_uid}_"
             
             # Generate occurrences
             for occurrence_start in rule.between(start_date, cutoff_date, inc=True):
@@ -333,22 +581,18 @@ class CalendarSyncICS:
                 
                 occurrence_end = occurrence_start + duration
                 
-                # Create event ID with timestamp
-                timestamp = occurrence_start.strftime('%Y%m%dT%H%M%S')
-                event_id = f"{base_uid}_{timestamp}"
-                
-                # Parse base event to get other fields
-                base_event_data = self._parse_ics_event(event, base_uid)
-                if not base_event_data:
-                    continue
+                # Create event ID with timestamp, taken from the ISO string
+                # ('YYYY-MM-DDTHH:MM:SS...' -> 'YYYYMMDDTHHMMSS'), cheaper than strftime
+                start_time = occurrence_start.isoformat()
+                event_id = base_uid_prefix + start_time[:19].replace('-', '').replace(':', '')
                 
                 # Update with occurrence times
-                occurrence_data = base_event_data.copy()
-                occurrence_data['id'] = event_id
-                occurrence_data['start_time'] = occurrence_start.isoformat()
-                occurrence_data['end_time'] = occurrence_end.isoformat()
-                
-                occurrences.append(occurrence_data)
+                occurrences.append({
+                    **base_event_data,
+                    'id': event_id,
+                    'start_time': start_time,
+                    'end_time': occurrence_end.isoformat()
+                })
             
         except Exception as e:
             logger.warning(f"Error expanding recurring event: {e}")
@@ -365,8 +609,9 @@ class CalendarSyncICS:
             logger.info("Starting Outlook Calendar sync (ICS Feed)")
             
             # Fetch ICS calendar
-            calendar = self._fetch_ics(OUTLOOK_ICS_URL)
-            if not calendar:
+            cached = self.db.get_feed_cache(OUTLOOK_ICS_URL)
+            response = self._fetch_ics(OUTLOOK_ICS_URL, cached)
+            if response is None:
                 logger.error("Failed to fetch ICS calendar")
                 return
             
@@ -374,32 +619,24 @@ class CalendarSyncICS:
             start_date, end_date = get_date_range(days_back, days_forward)
             cutoff_date = end_date + timedelta(days=1)  # Include events that start on end_date
             
-            appointments = []
-            
-            # Process events
-            for component in calendar.walk():
-                if component.name == 'VEVENT':
-                    base_uid = str(component.get('UID', ''))
-                    if not base_uid:
-                        continue
-                    
-                    # Check if recurring event
-                    rrule = component.get('RRULE')
-                    
-                    if rrule:
-                        # Expand recurring event
-                        occurrences = self._expand_recurring_event(component, start_date, cutoff_date)
-                        appointments.extend(occurrences)
+            # Process events as they stream in; large feeds are spread across processes
+            try:
+                with response:
+                    if response.status_code == 304:
+                        # Unchanged feeds still need re-expanding (the sync window moves), so reuse the cached body
+                        logger.info("ICS feed unchanged since last sync, using cached copy")
+                        lines = cached['body'].splitlines()
                     else:
-                        # Single event
-                        event_data = self._parse_ics_event(component, base_uid)
-                        if event_data:
-                            # Check if event is in date range
-                            start_dt = parse_iso_datetime(event_data['start_time'])
-                            if start_dt:
-                                start_utc = normalize_to_utc(start_dt)
-                                if start_date <= start_utc <= cutoff_date:
-                                    appointments.append(event_data)
+                        lines = self._iter_feed_lines(OUTLOOK_ICS_URL, response)
+                    
+                    appointments = self._process_blocks(_iter_component_blocks(lines), start_date, cutoff_date)
+            except requests.RequestException as e:
+                logger.error(f"Failed to download ICS feed: {e}")
+                return
+            
+            # One row per id before the batch save (e.g. a UID published twice); a later
+            # copy of an id replaces an earlier one (the position of the first is kept)
+            appointments = list({a['id']: a for a in appointments}.values())
             
             logger.info(f"Parsed {len(appointments)} appointments from ICS feed")
             
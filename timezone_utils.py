@@ -5,7 +5,8 @@ Unified Timezone Handling Utilities
 Provides consistent timezone conversion and parsing across all sync scripts.
 """
 
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timezone, timedelta
+from functools import lru_cache
 from typing import Optional
 
 try:
@@ -23,6 +24,16 @@ except ImportError:
         except ImportError:
             _pytz = None
 
+# Resolve the Pacific tzinfo once; normalize_to_pacific runs several times per parsed event
+if ZoneInfo:
+    _PACIFIC = ZoneInfo('America/Los_Angeles')
+elif _pytz:
+    _PACIFIC = _pytz.timezone('America/Los_Angeles')
+else:
+    # No timezone library available - fixed UTC-8 offset as last resort
+    # Note: This does NOT handle DST correctly
+    _PACIFIC = timezone(timedelta(hours=-8))
+
 
 def normalize_to_utc(dt: datetime) -> datetime:
     """
@@ -150,27 +161,55 @@ def normalize_to_pacific(dt: datetime) -> datetime:
     Raises:
         RuntimeError: If neither zoneinfo nor pytz is available
     """
-    if ZoneInfo:
-        pacific_tz = ZoneInfo('America/Los_Angeles')
-        # If naive, assume it's already in Pacific timezone
-        if dt.tzinfo is None:
-            return dt.replace(tzinfo=pacific_tz)
-        # Convert to Pacific timezone (handles DST correctly)
-        return dt.astimezone(pacific_tz)
-    elif _pytz:
-        # Fallback to pytz if zoneinfo not available
-        pacific_tz = _pytz.timezone('America/Los_Angeles')
+    if dt.tzinfo is None:
         # If naive, assume it's already in Pacific timezone
-        if dt.tzinfo is None:
-            return pacific_tz.localize(dt)
-        # Convert to Pacific timezone
-        return dt.astimezone(pacific_tz)
-    else:
-        # No timezone library available - return with fixed UTC-8 offset as last resort
-        # Note: This does NOT handle DST correctly
-        from datetime import timezone as tz
-        pst_offset = tz(timedelta(hours=-8))
-        if dt.tzinfo is None:
-            return dt.replace(tzinfo=pst_offset)
-        return dt.astimezone(pst_offset)
+        if _pytz and not ZoneInfo:
+            return _PACIFIC.localize(dt)
+        return dt.replace(tzinfo=_PACIFIC)
+    # Convert to Pacific timezone (handles DST correctly)
+    return dt.astimezone(_PACIFIC)
+
 
+def pacific_isoformat(dt: datetime) -> str:
+    """
+    Format datetime as an ISO8601 string in Pacific timezone.
+    
+    Equivalent to normalize_to_pacific(dt).isoformat(), memoized for aware
+    datetimes since feeds repeat the same instants across events and syncs.
+    
+    Args:
+        dt: Datetime object (timezone-aware or naive)
+    
+    Returns:
+        ISO8601 formatted string with Pacific offset
+    """
+    if dt.tzinfo is None:
+        return normalize_to_pacific(dt).isoformat()
+    if dt.tzinfo is _PACIFIC:
+        # Already Pacific (normalize_to_pacific would return it unchanged)
+        return dt.isoformat()
+    # (wall time, UTC offset) identifies the instant regardless of the source tzinfo
+    return _pacific_isoformat(dt.replace(tzinfo=None), dt.utcoffset())
+
+
+@lru_cache(maxsize=1024)
+def _pacific_isoformat(wall_time: datetime, utc_offset: timedelta) -> str:
+    """Cached worker for pacific_isoformat."""
+    return normalize_to_pacific(wall_time.replace(tzinfo=timezone(utc_offset))).isoformat()
+
+
+@lru_cache(maxsize=4096)
+def pacific_midnight(d: date) -> datetime:
+    """
+    Get midnight Pacific time on a calendar date (start of an all-day event).
+    
+    Memoized since feeds dominated by all-day events (birthdays, holidays)
+    convert the same dates over and over.
+    
+    Args:
+        d: Date object
+    
+    Returns:
+        Timezone-aware datetime at 00:00 Pacific (PST/PDT as appropriate)
+    """
+    return normalize_to_pacific(datetime.combine(d, datetime.min.time()))